@@ -1,4 +1,6 @@
 # backend/app/api/admin_deposits.py
+import json
+import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
@@ -11,9 +13,13 @@ from sqlalchemy import func as sqlfunc
 
 from app.core.db import get_db
 from app.core.auth import get_current_admin, get_current_any_admin
-from app.models import DepositRequest, User, Point, ExchangeRate, Notification
+from app.models import DepositRequest, User, Point, Notification
 from app.schemas.deposits import DepositRequestOut, AdminDepositRequestOut
+from app.services.exchange_rate import get_rate_snapshot
 from app.services.telegram import notify_deposit_approved
+from app.services.usdt_stats import invalidate_stats_cache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin/deposits", tags=["admin:deposits"])
 
@@ -77,15 +83,18 @@ def approve_deposit(
     if not user:
         raise HTTPException(404, "해당 입금을 신청한 유저를 찾을 수 없습니다.")
 
-    # 소수점 식별자 제거 후 정수 기준 JOY 계산
+    # 활성 환율은 JOY 재계산과 추천 보상에서 공용으로 사용 (1회만 조회)
+    rate = get_rate_snapshot(db)
+
+    # 실제 입금액(float)은 여기서 한 번만 계산해 JOY 재계산/추천 보상/알림에서 재사용
     actual = float(dr.actual_amount or dr.expected_amount)
+    # 소수점 식별자 제거 후 정수 기준 JOY 계산
     expected_base = int(float(dr.expected_amount))
     actual_base = int(actual)
 
     if actual_base < expected_base:
         # 부족 입금 → actual 기준으로 JOY 재계산
-        rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-        joy_per_usdt = float(rate.joy_per_usdt) if rate else 5.0
+        joy_per_usdt = rate["joy_per_usdt"]
         dr.joy_amount = int(actual_base * joy_per_usdt)
 
     # 이미 wallet_monitor가 자동 지급했으면 중복 지급 방지
@@ -96,9 +105,8 @@ def approve_deposit(
     if user.referred_by:
         referrer = db.query(User).filter(User.id == user.referred_by).first()
         if referrer:
-            rate_obj = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-            bonus_pct = rate_obj.referral_bonus_percent if rate_obj else 10
-            usdt_amount = float(dr.actual_amount or dr.expected_amount or 0)
+            bonus_pct = rate["referral_bonus_percent"]
+            usdt_amount = actual
             bonus_points = int(usdt_amount * bonus_pct / 100)
             if bonus_points > 0:
                 current_balance = db.query(
@@ -116,17 +124,18 @@ def approve_deposit(
                 referrer.total_points = int(referrer.total_points or 0) + bonus_points
 
     # 사용자 알림 생성 (승인)
-    import json
     notif = Notification(
         user_id=user.id,
         title="deposit_approved",
-        message=json.dumps({"amount": int(dr.actual_amount or dr.expected_amount), "joy": int(dr.joy_amount or 0)}),
+        message=json.dumps({"amount": int(actual), "joy": int(dr.joy_amount or 0)}),
         type="deposit_approved",
         is_read=False,
     )
     db.add(notif)
     db.commit()
     db.refresh(dr)
+    # 승인 입금 합계가 바뀌었으므로 US어드민 통계 캐시 무효화
+    invalidate_stats_cache()
 
     # 텔레그램 알림 전송
     try:
@@ -137,7 +146,7 @@ def approve_deposit(
             deposit_id=dr.id
         )
     except Exception as e:
-        print(f"텔레그램 알림 실패 (무시): {e}")
+        logger.warning("텔레그램 알림 실패 (무시): %s", e)
 
     return dr
 
@@ -166,7 +175,6 @@ def reject_deposit(
     dr.admin_notes = reason
 
     # 사용자 알림 생성 (거절)
-    import json
     notif = Notification(
         user_id=dr.user_id,
         title="deposit_rejected",
@@ -187,16 +195,20 @@ def get_deposit_stats(
     admin: User = Depends(get_current_any_admin),
 ):
     total_users = db.query(sqlfunc.count(User.id)).scalar()
-    total_deposits = db.query(sqlfunc.count(DepositRequest.id)).scalar()
-    total_approved_usdt = db.query(
-        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.actual_amount), 0)
-    ).filter(DepositRequest.status == "approved").scalar()
-    total_approved_joy = db.query(
-        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.joy_amount), 0)
-    ).filter(DepositRequest.status == "approved").scalar()
-    pending_count = db.query(sqlfunc.count(DepositRequest.id)).filter(DepositRequest.status == "pending").scalar()
-    approved_count = db.query(sqlfunc.count(DepositRequest.id)).filter(DepositRequest.status == "approved").scalar()
-    rejected_count = db.query(sqlfunc.count(DepositRequest.id)).filter(DepositRequest.status == "rejected").scalar()
+
+    # 상태별 건수/합계를 GROUP BY 한 번으로 집계 (count/sum 쿼리 6회 → 1회)
+    status_rows = db.query(
+        DepositRequest.status,
+        sqlfunc.count(DepositRequest.id),
+        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.actual_amount), 0),
+        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.joy_amount), 0),
+    ).group_by(DepositRequest.status).all()
+    by_status = {status: (count, usdt, joy) for status, count, usdt, joy in status_rows}
+
+    total_deposits = sum(count for count, _, _ in by_status.values())
+    approved_count, total_approved_usdt, total_approved_joy = by_status.get("approved", (0, 0, 0))
+    pending_count = by_status.get("pending", (0, 0, 0))[0]
+    rejected_count = by_status.get("rejected", (0, 0, 0))[0]
 
     # 섹터별 통계
     sector_stats = db.query(
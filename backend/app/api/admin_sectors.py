@@ -41,17 +41,24 @@ def list_sectors(
     admin: User = Depends(get_current_admin),
 ):
     sectors = db.query(Sector).order_by(Sector.id).all()
+
+    # 섹터별 매니저를 한 번에 조회 (섹터마다 쿼리하던 N+1 제거)
+    # 섹터당 매니저가 여럿이면 id가 가장 작은 1명만 사용
+    managers: dict[int, tuple[int, str]] = {}
+    for manager_id, sector_id, email in db.query(User.id, User.sector_id, User.email).filter(
+        User.role == "sector_manager", User.sector_id.isnot(None)
+    ).order_by(User.id):
+        managers.setdefault(sector_id, (manager_id, email))
+
     result = []
     for s in sectors:
-        manager = db.query(User).filter(
-            User.sector_id == s.id, User.role == "sector_manager"
-        ).first()
+        manager_id, manager_email = managers.get(s.id, (None, None))
         result.append({
             "id": s.id,
             "name": s.name,
             "fee_percent": s.fee_percent,
-            "manager_email": manager.email if manager else None,
-            "manager_id": manager.id if manager else None,
+            "manager_email": manager_email,
+            "manager_id": manager_id,
         })
     return result
 
@@ -7,6 +7,8 @@ from app.core.auth import get_current_admin
 from app.core.config import settings
 from app.core.db import get_db
 from app.models import User, ExchangeRate
+from app.services.exchange_rate import invalidate_rate_cache
+from app.services.usdt_stats import invalidate_stats_cache
 
 router = APIRouter(prefix="/admin/settings", tags=["admin:settings"])
 
@@ -51,6 +53,7 @@ def update_referral_bonus(
         raise HTTPException(404, "환율 설정을 찾을 수 없습니다")
     rate.referral_bonus_percent = data.referral_bonus_percent
     db.commit()
+    invalidate_rate_cache()
     return {"ok": True, "referral_bonus_percent": rate.referral_bonus_percent}
 
 
@@ -71,6 +74,9 @@ def update_usdt_display_percent(
         raise HTTPException(404, "환율 설정을 찾을 수 없습니다")
     rate.usdt_display_percent = data.usdt_display_percent
     db.commit()
+    invalidate_rate_cache()
+    # US어드민 통계 캐시는 비율이 이미 곱해진 값이므로 함께 무효화
+    invalidate_stats_cache()
     return {"ok": True, "usdt_display_percent": rate.usdt_display_percent}
 
 
@@ -94,6 +100,7 @@ def update_exchange_rate(
     usdt_to_krw = float(rate.usdt_to_krw) or 1300.0
     rate.joy_to_krw = round(usdt_to_krw / data.joy_per_usdt, 2)
     db.commit()
+    invalidate_rate_cache()
     return {
         "ok": True,
         "joy_per_usdt": float(rate.joy_per_usdt),
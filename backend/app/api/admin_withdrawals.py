@@ -1,4 +1,5 @@
 # backend/app/api/admin_withdrawals.py
+import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
@@ -11,6 +12,8 @@ from app.models import User
 from app.models.joy_withdrawal import JoyWithdrawal
 from app.services.telegram import notify_withdrawal_approved
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/admin/withdrawals", tags=["admin:withdrawals"])
 
 
@@ -99,7 +102,7 @@ def approve_withdrawal(
             withdrawal_id=w.id,
         )
     except Exception as e:
-        print(f"텔레그램 알림 실패 (무시): {e}")
+        logger.warning("텔레그램 알림 실패 (무시): %s", e)
 
     return _to_out(w)
 
@@ -3,8 +3,9 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.core.security import hash_password, verify_password, create_access_token
 from app.schemas.auth import SignupIn, LoginIn, Tokens
-from app.models import User, Center, Referral, Sector, LegalConsent, ExchangeRate
+from app.models import User, Center, Referral, Sector, LegalConsent
 from app.core.config import settings
+from app.services.exchange_rate import get_rate_snapshot
 from jose import jwt, JWTError
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -153,8 +154,7 @@ async def get_me(current_user: User = Depends(get_current_user), db: Session = D
             "region": current_user.center.region,
         }
 
-    rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-    bonus_pct = rate.referral_bonus_percent if rate else 10
+    bonus_pct = get_rate_snapshot(db)["referral_bonus_percent"]
 
     return {
         "id": current_user.id,
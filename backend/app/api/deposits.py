@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core.config import settings
 from app.core.db import get_db
 from app.core.auth import get_current_user
 from app.models import User, DepositRequest
@@ -24,7 +25,13 @@ def request_deposit(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    return create_deposit_request(db, user, data)
+    deposit = create_deposit_request(db, user, data)
+    # 유휴 간격으로 대기 중인 지갑 모니터를 깨워 기본 폴링 간격으로 복귀
+    # (모니터는 Solana 주소가 설정된 경우에만 돌므로 그때만 모듈을 로드 — main.on_startup과 동일)
+    if settings.USDT_ADMIN_ADDRESS_SOLANA:
+        from app.services.wallet_monitor import wake_wallet_monitor
+        wake_wallet_monitor()
+    return deposit
 
 
 @router.get("/my")
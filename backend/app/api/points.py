@@ -160,13 +160,18 @@ def admin_list_withdrawals(
 
     withdrawals = q.limit(200).all()
 
+    # 신청자 이메일을 행마다 조회하지 않고 한 번의 IN 쿼리로 조회
+    user_ids = {w.user_id for w in withdrawals}
+    emails = dict(
+        db.query(User.id, User.email).filter(User.id.in_(user_ids)).all()
+    ) if user_ids else {}
+
     result = []
     for w in withdrawals:
-        user = db.query(User).filter(User.id == w.user_id).first()
         result.append({
             "id": w.id,
             "user_id": w.user_id,
-            "user_email": user.email if user else "unknown",
+            "user_email": emails.get(w.user_id, "unknown"),
             "amount": w.amount,
             "method": w.method,
             "account_info": w.account_info,
@@ -19,26 +19,32 @@ def sector_dashboard(
     """섹터 매니저 대시보드: 내 섹터 정보 + 통계"""
     sector = db.query(Sector).filter(Sector.id == manager.sector_id).first()
 
-    # 이 섹터에 배정된 모든 유저 (sector_id가 같은 일반 유저들)
-    sector_users = db.query(User).filter(User.sector_id == sector.id).all()
-    sector_user_ids = [u.id for u in sector_users]
-
-    # 이 섹터 유저들의 입금 요청
-    total_deposits = 0.0
-    approved_count = 0
-    pending_count = 0
-
-    if sector_user_ids:
-        deposits = db.query(DepositRequest).filter(
-            DepositRequest.user_id.in_(sector_user_ids)
-        ).all()
+    # 이 섹터에 배정된 유저 수 (sector_id가 같은 일반 유저들)
+    total_users = db.query(func.count(User.id)).filter(User.sector_id == sector.id).scalar()
+
+    # 이 섹터 유저들의 입금 요청 통계
+    # 전체 입금 행을 파이썬으로 가져와 합산하지 않고 DB에서 상태별로 한 번에 집계
+    status_rows = (
+        db.query(
+            DepositRequest.status,
+            func.count(DepositRequest.id),
+            func.coalesce(
+                func.sum(func.coalesce(DepositRequest.actual_amount, DepositRequest.expected_amount)), 0
+            ),
+        )
+        .join(User, User.id == DepositRequest.user_id)
+        .filter(
+            User.sector_id == sector.id,
+            DepositRequest.status.in_(("approved", "pending")),
+        )
+        .group_by(DepositRequest.status)
+        .all()
+    )
+    by_status = {status: (count, amount) for status, count, amount in status_rows}
 
-        for d in deposits:
-            if d.status == "approved":
-                total_deposits += float(d.actual_amount or d.expected_amount)
-                approved_count += 1
-            elif d.status == "pending":
-                pending_count += 1
+    approved_count, approved_amount = by_status.get("approved", (0, 0))
+    pending_count, _ = by_status.get("pending", (0, 0))
+    total_deposits = float(approved_amount)
 
     fee_amount = total_deposits * (sector.fee_percent / 100)
 
@@ -49,7 +55,7 @@ def sector_dashboard(
             "fee_percent": sector.fee_percent,
         },
         "stats": {
-            "total_users": len(sector_user_ids),
+            "total_users": total_users,
             "total_approved_deposits": total_deposits,
             "fee_amount": round(fee_amount, 2),
             "approved_count": approved_count,
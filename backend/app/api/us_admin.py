@@ -1,22 +1,23 @@
 # backend/app/api/us_admin.py
+import logging
 from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sqlfunc
 from pydantic import BaseModel
 
 from app.core.db import get_db
 from app.core.auth import get_current_us_admin, get_current_admin
-from app.models import User, DepositRequest, UsdtWithdrawal, ExchangeRate
+from app.models import User, UsdtWithdrawal
 from app.services.telegram import notify_usdt_withdrawal_request
+from app.services.usdt_stats import (
+    get_display_ratio,
+    get_usdt_stats_snapshot,
+    invalidate_stats_cache,
+    usdt_totals,
+)
 
-
-def _get_display_ratio(db: Session) -> float:
-    """관리자가 설정한 USDT 표시 비율 (0.0 ~ 1.0), 기본 0.5"""
-    rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-    pct = rate.usdt_display_percent if rate else 50
-    return pct / 100.0
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/us-admin", tags=["us-admin"])
 
@@ -28,28 +29,7 @@ def get_usdt_stats(
     admin=Depends(get_current_us_admin),
 ):
     """총 USDT 수령액, 확정 출금액, 잔여 USDT"""
-    ratio = _get_display_ratio(db)
-
-    total_received_actual = float(db.query(
-        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.actual_amount), 0)
-    ).filter(DepositRequest.status == "approved").scalar())
-
-    total_withdrawn = float(db.query(
-        sqlfunc.coalesce(sqlfunc.sum(UsdtWithdrawal.amount), 0)
-    ).filter(UsdtWithdrawal.status == "confirmed").scalar())
-
-    pending_withdrawal = float(db.query(
-        sqlfunc.coalesce(sqlfunc.sum(UsdtWithdrawal.amount), 0)
-    ).filter(UsdtWithdrawal.status == "pending").scalar())
-
-    displayed_received = total_received_actual * ratio
-
-    return {
-        "total_received_usdt": displayed_received,
-        "total_withdrawn_usdt": total_withdrawn,
-        "pending_withdrawal_usdt": pending_withdrawal,
-        "available_usdt": displayed_received - total_withdrawn - pending_withdrawal,
-    }
+    return get_usdt_stats_snapshot(db)
 
 
 # ── 미국어드민: USDT 출금 신청 ──
@@ -69,19 +49,8 @@ def request_usdt_withdrawal(
         raise HTTPException(400, "출금 금액은 0보다 커야 합니다.")
 
     # 현재 가용 USDT 계산 (관리자 설정 비율만 가용)
-    ratio = _get_display_ratio(db)
-
-    total_received_actual = float(db.query(
-        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.actual_amount), 0)
-    ).filter(DepositRequest.status == "approved").scalar())
-
-    total_withdrawn = float(db.query(
-        sqlfunc.coalesce(sqlfunc.sum(UsdtWithdrawal.amount), 0)
-    ).filter(UsdtWithdrawal.status == "confirmed").scalar())
-
-    pending = float(db.query(
-        sqlfunc.coalesce(sqlfunc.sum(UsdtWithdrawal.amount), 0)
-    ).filter(UsdtWithdrawal.status == "pending").scalar())
+    ratio = get_display_ratio(db)
+    total_received_actual, total_withdrawn, pending = usdt_totals(db)
 
     available = total_received_actual * ratio - total_withdrawn - pending
 
@@ -98,6 +67,7 @@ def request_usdt_withdrawal(
     db.add(withdrawal)
     db.commit()
     db.refresh(withdrawal)
+    invalidate_stats_cache()
 
     try:
         notify_usdt_withdrawal_request(
@@ -108,7 +78,7 @@ def request_usdt_withdrawal(
             total_usdt=total_received_actual,
         )
     except Exception as e:
-        print(f"텔레그램 알림 실패 (무시): {e}")
+        logger.warning("텔레그램 알림 실패 (무시): %s", e)
 
     return {"id": withdrawal.id, "amount": withdrawal.amount, "status": withdrawal.status}
 
@@ -159,6 +129,7 @@ def confirm_withdrawal(
     w.confirmed_at = datetime.utcnow()
     w.admin_notes = payload.admin_notes
     db.commit()
+    invalidate_stats_cache()
     return {"id": w.id, "status": w.status}
 
 
@@ -180,4 +151,5 @@ def reject_withdrawal(
     w.confirmed_at = datetime.utcnow()
     w.admin_notes = payload.admin_notes
     db.commit()
+    invalidate_stats_cache()
     return {"id": w.id, "status": w.status}
@@ -1,4 +1,5 @@
 # backend/app/api/withdrawals.py
+import logging
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -12,6 +13,8 @@ from app.models import User
 from app.models.joy_withdrawal import JoyWithdrawal
 from app.services.telegram import notify_withdrawal_request
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/withdrawals", tags=["withdrawals"])
 
 # ──────────────────────────────────────────────
@@ -64,6 +67,18 @@ def request_withdrawal(
     if data.amount < CLAIM_MIN_AMOUNT:
         raise HTTPException(400, f"최소 수령 수량은 {CLAIM_MIN_AMOUNT:,} JOY입니다.")
 
+    # ── 수량 검증 ──
+    # 입력값/보유량만으로 판단 가능한 검증을 DB 조회(하루 1번 제한)보다 먼저 수행
+    if data.amount > int(user.total_joy or 0):
+        raise HTTPException(400, f"보유 JOY({int(user.total_joy or 0):,})가 부족합니다.")
+
+    if not data.wallet_address or len(data.wallet_address.strip()) < 6:
+        raise HTTPException(400, "유효한 지갑 주소를 입력해주세요.")
+
+    valid_chains = ["Solana"]
+    if data.chain not in valid_chains:
+        raise HTTPException(400, f"지원하지 않는 체인입니다. ({', '.join(valid_chains)})")
+
     # ── 하루 1번 제한 검증 ──
     today_start_kst = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
     today_start_utc = today_start_kst.astimezone(timezone.utc).replace(tzinfo=None)
@@ -76,17 +91,6 @@ def request_withdrawal(
     if today_count >= CLAIM_MAX_PER_DAY:
         raise HTTPException(400, "오늘은 이미 수령 신청을 하셨습니다. 내일 다시 신청해주세요.")
 
-    # ── 수량 검증 ──
-    if data.amount > int(user.total_joy or 0):
-        raise HTTPException(400, f"보유 JOY({int(user.total_joy or 0):,})가 부족합니다.")
-
-    if not data.wallet_address or len(data.wallet_address.strip()) < 6:
-        raise HTTPException(400, "유효한 지갑 주소를 입력해주세요.")
-
-    valid_chains = ["Solana"]
-    if data.chain not in valid_chains:
-        raise HTTPException(400, f"지원하지 않는 체인입니다. ({', '.join(valid_chains)})")
-
     # JOY 차감
     user.total_joy = int(user.total_joy or 0) - data.amount
 
@@ -112,7 +116,7 @@ def request_withdrawal(
             withdrawal_id=withdrawal.id,
         )
     except Exception as e:
-        print(f"텔레그램 알림 실패 (무시): {e}")
+        logger.warning("텔레그램 알림 실패 (무시): %s", e)
 
     return WithdrawalOut(
         id=withdrawal.id,
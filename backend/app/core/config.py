@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     JWT_EXPIRE_MIN: int = 20
     CORS_ORIGINS: str = "http://localhost:3000"
 
+    # 로그 레벨 (DEBUG/INFO/WARNING/ERROR) - 운영에서는 WARNING으로 올려 INFO 로그 포맷 비용 절감
+    LOG_LEVEL: str = "INFO"
+
     # 체인별 USDT 입금 주소
     USDT_ADMIN_ADDRESS: str | None = None          # Polygon/Ethereum (EVM 공용, 레거시)
     USDT_ADMIN_ADDRESS_TRON: str | None = None      # TRON (TRC-20, 레거시)
@@ -12,6 +12,8 @@ TTL_SECONDS = 15 * 60  # 15분
 
 # Redis 사용 가능 시 사용, 불가 시 메모리 fallback (로컬/Redis 미설정 시 500 방지)
 _redis = None
+# 토큰 키 → (이메일, 만료 시각). 만료 시각은 time.monotonic() 기준
+# (같은 프로세스 메모리에만 있으므로 wall-clock 대신 시계 조정(NTP)에 영향 없는 monotonic 사용)
 _memory_store: dict[str, tuple[str, float]] = {}
 
 
@@ -42,20 +44,21 @@ def generate_email_verify_link(email: str) -> str:
         except Exception as e:
             logger.warning("Redis setex failed, using memory: %s", e)
             _memory_store[f"{VERIFY_PREFIX}{token}"] = (
-                email, time.time() + TTL_SECONDS
+                email, time.monotonic() + TTL_SECONDS
             )
     else:
         _memory_store[f"{VERIFY_PREFIX}{token}"] = (
-            email, time.time() + TTL_SECONDS
+            email, time.monotonic() + TTL_SECONDS
         )
     return f"{BACKEND_PUBLIC_URL}/auth/verify-email?token={token}"
 
 
 def _memory_get(key: str) -> str | None:
-    if key not in _memory_store:
+    entry = _memory_store.get(key)
+    if entry is None:
         return None
-    email, expiry = _memory_store[key]
-    if time.time() > expiry:
+    email, expiry = entry
+    if time.monotonic() > expiry:
         del _memory_store[key]
         return None
     return email
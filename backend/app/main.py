@@ -1,6 +1,9 @@
 # backend/app/main.py
 import os
+import queue
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -28,6 +31,8 @@ from sqlalchemy import inspect, text
 from app.core.config import settings
 from app.core.security import hash_password
 from app.core.enums import UserRole
+from app.services.exchange_rate import get_rate_snapshot
+from app.services.telegram import shutdown_notifications
 
 # 새로운 모델 import
 from app.models import (
@@ -38,9 +43,19 @@ from app.models.point_withdrawal import PointWithdrawal
 from app.models.joy_withdrawal import JoyWithdrawal
 from app.models.user import generate_recovery_code
 
-logging.basicConfig(level=logging.INFO)
+# 로그 출력은 QueueListener 전용 스레드가 담당
+# 요청 처리/지갑 모니터 스레드는 큐에 레코드만 넣고 바로 반환 → stdout I/O에 블로킹되지 않음
+# (포맷은 QueueHandler에서 적용되므로 출력 핸들러는 완성된 메시지만 기록)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(level=settings.LOG_LEVEL.upper(), handlers=[QueueHandler(_log_queue)])
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# 지갑 모니터 백그라운드 스레드 (shutdown 시 종료 대기용)
+_MONITOR_JOIN_TIMEOUT = 5.0  # 초
+_monitor_thread: threading.Thread | None = None
+
 app = FastAPI(title="JoyCoin Website API")
 
 origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")]
@@ -105,12 +120,12 @@ def on_startup():
     generate_recovery_codes()
 
     # 지갑 모니터링 백그라운드 스레드 시작 (Solana)
+    global _monitor_thread
     has_solana = settings.USDT_ADMIN_ADDRESS_SOLANA
     if has_solana:
-        import threading
         from app.services.wallet_monitor import wallet_monitor_loop
-        monitor_thread = threading.Thread(target=wallet_monitor_loop, daemon=True)
-        monitor_thread.start()
+        _monitor_thread = threading.Thread(target=wallet_monitor_loop, name="wallet-monitor", daemon=True)
+        _monitor_thread.start()
         logger.info("Wallet monitor started for: Solana")
     else:
         logger.warning("Wallet monitor NOT started - USDT_ADMIN_ADDRESS_SOLANA not configured")
@@ -118,6 +133,23 @@ def on_startup():
     logger.info("Application startup complete.")
 
 
+@app.on_event("shutdown")
+def on_shutdown():
+    # 지갑 모니터 종료 신호 → 대기 중이면 즉시 깨어나 종료, 폴링 중이면 그 폴링까지만 수행
+    # (daemon 스레드이므로 timeout 안에 끝나지 않아도 프로세스 종료는 막지 않음)
+    if _monitor_thread is not None:
+        from app.services.wallet_monitor import stop_wallet_monitor
+        stop_wallet_monitor()
+        _monitor_thread.join(timeout=_MONITOR_JOIN_TIMEOUT)
+        if _monitor_thread.is_alive():
+            logger.warning("Wallet monitor did not stop within %.0fs", _MONITOR_JOIN_TIMEOUT)
+
+    # 대기 중인 텔레그램 전송을 마저 보낸 뒤(전송 스레드의 로그도 큐에 들어간 뒤)
+    # 큐에 남은 로그를 모두 출력하고 리스너 스레드 종료
+    shutdown_notifications()
+    _log_listener.stop()
+
+
 def ensure_schema_compatibility():
     """
     Lightweight schema backfill for environments that start with an existing DB
@@ -167,7 +199,7 @@ def seed_super_admin():
         )
         db.add(admin)
         db.commit()
-        logger.info(f"Super admin created: {settings.SUPER_ADMIN_EMAIL}")
+        logger.info("Super admin created: %s", settings.SUPER_ADMIN_EMAIL)
 
 
 def seed_initial_data():
@@ -248,7 +280,7 @@ def generate_recovery_codes():
             for user in users_without_code:
                 user.recovery_code = generate_recovery_code()
             db.commit()
-            logger.info(f"- Generated recovery codes for {len(users_without_code)} users")
+            logger.info("- Generated recovery codes for %d users", len(users_without_code))
 
 
 @app.get("/healthz")
@@ -259,13 +291,11 @@ def healthz():
 @app.get("/exchange-rate", tags=["exchange"])
 def get_exchange_rate(db: Session = Depends(get_db)):
     """현재 JOY/USDT 환율 조회 (공개)"""
-    rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-    if not rate:
-        return {"joy_per_usdt": 5.0, "joy_to_krw": 260.0, "usdt_to_krw": 1300.0}
+    rate = get_rate_snapshot(db)
     return {
-        "joy_per_usdt": float(rate.joy_per_usdt),
-        "joy_to_krw": float(rate.joy_to_krw),
-        "usdt_to_krw": float(rate.usdt_to_krw),
+        "joy_per_usdt": rate["joy_per_usdt"],
+        "joy_to_krw": rate["joy_to_krw"],
+        "usdt_to_krw": rate["usdt_to_krw"],
     }
 
 
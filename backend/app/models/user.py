@@ -17,14 +17,17 @@ if TYPE_CHECKING:
     from app.models.referral import Referral
 
 
+# 추천인/복구 코드 문자 집합 (대문자 + 숫자, 모듈 로드 시 1회 생성)
+_CODE_ALPHABET = string.ascii_uppercase + string.digits
+
+
 def generate_referral_code() -> str:
     """
     추천인 코드 자동 생성
     형식: JOY + 5자리 영숫자 대문자
     예시: JOY7K2M9, JOYA3X5T
     """
-    chars = string.ascii_uppercase + string.digits
-    random_part = ''.join(secrets.choice(chars) for _ in range(5))
+    random_part = ''.join(secrets.choice(_CODE_ALPHABET) for _ in range(5))
     return f"JOY{random_part}"
 
 
@@ -34,8 +37,7 @@ def generate_recovery_code() -> str:
     형식: RCV + 8자리 영숫자 대문자
     예시: RCVAB12CD34
     """
-    chars = string.ascii_uppercase + string.digits
-    random_part = ''.join(secrets.choice(chars) for _ in range(8))
+    random_part = ''.join(secrets.choice(_CODE_ALPHABET) for _ in range(8))
     return f"RCV{random_part}"
 
 
@@ -1,12 +1,30 @@
 # backend/app/services/deposits.py
+import logging
 import random
 from sqlalchemy.orm import Session
 from decimal import Decimal
 
-from app.models import User, DepositRequest, ExchangeRate
+from app.models import User, DepositRequest
 from app.core.config import settings
+from app.services.exchange_rate import get_rate_snapshot
 from app.services.telegram import notify_new_deposit_request
 
+logger = logging.getLogger(__name__)
+
+# 고유 소수점 식별자 후보 (센트 단위 1 ~ 99 = 0.01 ~ 0.99), 모두 사용 중일 때의 예비 후보 (0.001 ~ 0.009)
+# 요청마다 다시 만들지 않도록 모듈 로드 시 1회 계산
+_DECIMAL_CANDIDATES = tuple(range(1, 100))
+_FALLBACK_DECIMALS = tuple(round(i / 1000, 3) for i in range(1, 10))
+
+
+def decimal_cents(amount) -> int:
+    """
+    금액의 소수점 식별자를 센트 정수로 반환 (예: 200.37 → 37).
+    float % 1 은 200.37 % 1 = 0.3700000000000045 처럼 오차가 생겨 round가 필요하므로
+    센트 단위 정수로 바꿔 정확히 비교 (Numeric/Decimal, float 모두 허용)
+    """
+    return round(float(amount) * 100) % 100
+
 
 def _get_address_for_chain(chain: str) -> str:
     """체인에 맞는 입금 주소 반환"""
@@ -30,20 +48,16 @@ def _generate_unique_decimal(db: Session, base_amount: float, chain: str) -> flo
         DepositRequest.status == "pending",
     ).all()
 
-    used_decimals = set()
-    for (amt,) in pending_amounts:
-        frac = round(float(amt) % 1, 2)
-        if frac > 0:
-            used_decimals.add(frac)
+    used_cents = {decimal_cents(amt) for (amt,) in pending_amounts}
 
     # 0.01 ~ 0.99 중 미사용 선택
-    available = [round(i / 100, 2) for i in range(1, 100) if round(i / 100, 2) not in used_decimals]
+    available = [c for c in _DECIMAL_CANDIDATES if c not in used_cents]
 
     if not available:
         # 극히 드문 케이스: 99개 모두 사용 중 → 0.001~0.009 추가 범위
-        available = [round(i / 1000, 3) for i in range(1, 10)]
-
-    decimal_part = random.choice(available)
+        decimal_part = random.choice(_FALLBACK_DECIMALS)
+    else:
+        decimal_part = random.choice(available) / 100
     return round(base_amount + decimal_part, 2)
 
 
@@ -53,9 +67,8 @@ def create_deposit_request(db: Session, user: User, data):
     # USDT 금액 (base)
     base_amt = float(data.amount_usdt)
 
-    # DB에서 현재 환율 조회 (관리자가 설정)
-    rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-    joy_per_usdt = float(rate.joy_per_usdt) if rate else 5.0
+    # 현재 환율 조회 (관리자가 설정, get_rate_snapshot의 짧은 TTL 캐시 사용)
+    joy_per_usdt = get_rate_snapshot(db)["joy_per_usdt"]
 
     # JOY는 원래 base 금액 기준으로 계산 (소수점 식별자 제외)
     joy_amount = int(base_amt * joy_per_usdt)
@@ -89,7 +102,7 @@ def create_deposit_request(db: Session, user: User, data):
             wallet_address=user.wallet_address,
         )
     except Exception as e:
-        print(f"텔레그램 알림 실패 (무시): {e}")
+        logger.warning("텔레그램 알림 실패 (무시): %s", e)
 
     return req
 
@@ -0,0 +1,56 @@
+# backend/app/services/exchange_rate.py
+import time
+
+from sqlalchemy.orm import Session
+
+from app.models import ExchangeRate
+
+# ──────────────────────────────────────────────
+# 활성 환율 스냅샷 TTL 캐시
+# 공개 /exchange-rate, /auth/me 등 자주 호출되는 조회 경로에서
+# 매 요청마다 exchange_rates 테이블을 다시 읽지 않도록 짧게 캐시
+# (관리자 설정 변경 시 invalidate_rate_cache()로 즉시 무효화)
+# ──────────────────────────────────────────────
+_RATE_CACHE_TTL = 5.0  # 초
+
+# 활성 환율이 없을 때 사용하는 기본값
+DEFAULT_RATE = {
+    "joy_per_usdt": 5.0,
+    "joy_to_krw": 260.0,
+    "usdt_to_krw": 1300.0,
+    "referral_bonus_percent": 10,
+    "usdt_display_percent": 50,
+}
+
+# (만료 시각(monotonic), 스냅샷)
+_rate_cache: tuple[float, dict] | None = None
+
+
+def get_rate_snapshot(db: Session) -> dict:
+    """활성 환율 값을 dict로 반환 (TTL 내에는 캐시 사용)"""
+    global _rate_cache
+
+    cached = _rate_cache
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
+    if rate:
+        snapshot = {
+            "joy_per_usdt": float(rate.joy_per_usdt),
+            "joy_to_krw": float(rate.joy_to_krw),
+            "usdt_to_krw": float(rate.usdt_to_krw),
+            "referral_bonus_percent": rate.referral_bonus_percent,
+            "usdt_display_percent": rate.usdt_display_percent,
+        }
+    else:
+        snapshot = dict(DEFAULT_RATE)
+
+    _rate_cache = (time.monotonic() + _RATE_CACHE_TTL, snapshot)
+    return snapshot
+
+
+def invalidate_rate_cache():
+    """환율 설정 변경 후 호출 → 다음 조회 시 DB에서 다시 읽음"""
+    global _rate_cache
+    _rate_cache = None
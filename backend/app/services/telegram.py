@@ -1,12 +1,46 @@
 # backend/app/services/telegram.py
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 KST = timezone(timedelta(hours=9))
 
+# 알림 전송 전용 스레드 풀
+# API 요청/입금 매칭 트랜잭션이 텔레그램 왕복(최대 timeout)만큼 블로킹되지 않도록
+# notify_* 함수는 전송을 풀에 제출만 하고 바로 반환
+_send_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="telegram")
+
+# sendMessage 엔드포인트 URL (봇 토큰은 실행 중 바뀌지 않으므로 1회만 생성)
+_SEND_MESSAGE_URL = (
+    f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
+    if settings.TELEGRAM_BOT_TOKEN
+    else None
+)
+
+# api.telegram.org 전용 keep-alive 세션
+# requests.post()는 알림마다 새 TCP+TLS 연결 → 세션으로 연결을 재사용
+# (풀 크기는 전송 스레드 수와 맞춤)
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+# (connect, read) 타임아웃 초 - 텔레그램 연결 불가 시 전송 스레드를 오래 붙잡지 않도록 연결은 짧게
+_SEND_TIMEOUT = (3, 10)
+
+
+# 체인별 tx 탐색기 URL 템플릿 (알림마다 dict/URL 3개를 새로 만들지 않도록 모듈 로드 시 1회 생성)
+_EXPLORER_TX_URLS = {
+    "Polygon": "https://polygonscan.com/tx/{}",
+    "Ethereum": "https://etherscan.io/tx/{}",
+    "TRON": "https://tronscan.org/#/transaction/{}",
+}
+
 
 def now_kst() -> str:
     return datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
@@ -14,11 +48,10 @@ def now_kst() -> str:
 
 def send_telegram_notification(message: str) -> bool:
     """Send a Telegram bot notification."""
-    if not settings.TELEGRAM_BOT_TOKEN or not settings.TELEGRAM_CHAT_ID:
-        print("Telegram bot settings are missing. Skipping notification.")
+    if not _SEND_MESSAGE_URL or not settings.TELEGRAM_CHAT_ID:
+        logger.debug("Telegram bot settings are missing. Skipping notification.")
         return False
 
-    url = f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
     payload = {
         "chat_id": settings.TELEGRAM_CHAT_ID,
         "text": message,
@@ -26,15 +59,32 @@ def send_telegram_notification(message: str) -> bool:
     }
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = _session.post(_SEND_MESSAGE_URL, json=payload, timeout=_SEND_TIMEOUT)
         response.raise_for_status()
-        print("Telegram notification sent")
+        logger.debug("Telegram notification sent")
         return True
     except Exception as e:
-        print(f"Telegram notification failed: {e}")
+        logger.warning("Telegram notification failed: %s", e)
         return False
 
 
+def _dispatch(message: str) -> Future:
+    """알림 전송을 백그라운드 풀에 제출 (호출자는 결과를 기다리지 않음)"""
+    try:
+        return _send_pool.submit(send_telegram_notification, message)
+    except RuntimeError:
+        # shutdown_notifications() 이후 제출 (종료 대기 timeout을 넘긴 모니터 스레드 등)
+        # → 예외로 입금 매칭 트랜잭션이 롤백되지 않도록 호출 스레드에서 직접 전송
+        future: Future = Future()
+        future.set_result(send_telegram_notification(message))
+        return future
+
+
+def shutdown_notifications():
+    """전송 풀 종료: 이미 제출된 알림 전송(과 그 로그)이 끝날 때까지 대기 (앱 shutdown 시 호출)"""
+    _send_pool.shutdown(wait=True)
+
+
 def notify_new_deposit_request(
     user_email: str,
     amount: float,
@@ -56,7 +106,7 @@ JOY 수령 지갑: <code>{wallet_address or '미등록'}</code>
 
 시간: {now_kst()}
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_deposit_approved(user_email: str, amount: float, joy_amount: int, deposit_id: int):
@@ -71,17 +121,12 @@ JOY 수량: {joy_amount:,} JOY
 
 사용자에게 JOY를 전송해 주세요.
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_deposit_detected(amount: float, sender: str, tx_hash: str, chain: str = "Polygon"):
     """온체인 USDT 입금 감지 알림 (미매칭 시)"""
-    explorer_urls = {
-        "Polygon": f"https://polygonscan.com/tx/{tx_hash}",
-        "Ethereum": f"https://etherscan.io/tx/{tx_hash}",
-        "TRON": f"https://tronscan.org/#/transaction/{tx_hash}",
-    }
-    explorer_url = explorer_urls.get(chain, f"https://polygonscan.com/tx/{tx_hash}")
+    explorer_url = _EXPLORER_TX_URLS.get(chain, _EXPLORER_TX_URLS["Polygon"]).format(tx_hash)
     message = f"""
 <b>🔔 USDT 입금 감지</b>
 
@@ -94,16 +139,12 @@ TX: <a href=\"{explorer_url}\">{tx_hash[:16]}...</a>
 
 관리자 대시보드에서 확인해 주세요.
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def _explorer_url(chain: str, tx_hash: str) -> str:
-    urls = {
-        "Polygon": f"https://polygonscan.com/tx/{tx_hash}",
-        "Ethereum": f"https://etherscan.io/tx/{tx_hash}",
-        "TRON": f"https://tronscan.org/#/transaction/{tx_hash}",
-    }
-    return urls.get(chain, tx_hash)
+    template = _EXPLORER_TX_URLS.get(chain)
+    return template.format(tx_hash) if template else tx_hash
 
 
 def notify_deposit_matched(
@@ -125,7 +166,7 @@ TX: <a href=\"{url}\">{tx_hash[:16]}...</a>
 
 시간: {now_kst()}
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_deposit_underpaid(
@@ -149,7 +190,7 @@ TX: <a href=\"{url}\">{tx_hash[:16]}...</a>
 관리자 확인이 필요합니다.
 시간: {now_kst()}
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_withdrawal_request(
@@ -173,7 +214,7 @@ def notify_withdrawal_request(
 
 관리자 대시보드에서 처리해 주세요.
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_withdrawal_approved(
@@ -195,7 +236,7 @@ def notify_withdrawal_approved(
 
 시간: {now_kst()}
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_usdt_withdrawal_request(
@@ -219,7 +260,7 @@ def notify_usdt_withdrawal_request(
 
 슈퍼관리자 대시보드에서 확정해 주세요.
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
 
 
 def notify_deposit_unmatched(amount: float, sender: str, tx_hash: str, chain: str):
@@ -238,4 +279,4 @@ TX: <a href=\"{url}\">{tx_hash[:16]}...</a>
 
 시간: {now_kst()}
 """
-    return send_telegram_notification(message)
+    return _dispatch(message)
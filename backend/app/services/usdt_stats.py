@@ -0,0 +1,75 @@
+# backend/app/services/usdt_stats.py
+import time
+
+from sqlalchemy import case, func as sqlfunc
+from sqlalchemy.orm import Session
+
+from app.models import DepositRequest, UsdtWithdrawal
+from app.services.exchange_rate import get_rate_snapshot
+
+# ──────────────────────────────────────────────
+# US어드민 USDT 통계 스냅샷 TTL 캐시
+# 대시보드가 자주 새로고침하는 /us-admin/stats는 짧게 캐시하고,
+# 집계에 영향을 주는 변경(출금 신청/확정/거절, 입금 승인, 표시 비율 변경) 후에는
+# invalidate_stats_cache()로 즉시 무효화
+# (출금 신청의 가용액 검증은 캐시를 쓰지 않고 항상 DB에서 새로 계산)
+# ──────────────────────────────────────────────
+_STATS_CACHE_TTL = 7.0  # 초
+
+# (만료 시각(monotonic), 응답 dict)
+_stats_cache: tuple[float, dict] | None = None
+
+
+def get_display_ratio(db: Session) -> float:
+    """관리자가 설정한 USDT 표시 비율 (0.0 ~ 1.0), 기본 0.5"""
+    return get_rate_snapshot(db)["usdt_display_percent"] / 100.0
+
+
+def usdt_totals(db: Session) -> tuple[float, float, float]:
+    """
+    (승인된 입금 실수령액 합계, 확정 출금액, 대기 중 출금액) 반환.
+    출금 두 합계는 status별 조건부 SUM으로 한 번에 집계 (쿼리 3회 → 2회)
+    """
+    total_received_actual = float(db.query(
+        sqlfunc.coalesce(sqlfunc.sum(DepositRequest.actual_amount), 0)
+    ).filter(DepositRequest.status == "approved").scalar())
+
+    withdrawn, pending = db.query(
+        sqlfunc.coalesce(sqlfunc.sum(
+            case((UsdtWithdrawal.status == "confirmed", UsdtWithdrawal.amount), else_=0)
+        ), 0),
+        sqlfunc.coalesce(sqlfunc.sum(
+            case((UsdtWithdrawal.status == "pending", UsdtWithdrawal.amount), else_=0)
+        ), 0),
+    ).filter(UsdtWithdrawal.status.in_(("confirmed", "pending"))).one()
+
+    return total_received_actual, float(withdrawn), float(pending)
+
+
+def get_usdt_stats_snapshot(db: Session) -> dict:
+    """총 USDT 수령액(표시 비율 적용), 확정/대기 출금액, 잔여 USDT (TTL 내에는 캐시 사용)"""
+    global _stats_cache
+
+    cached = _stats_cache
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    ratio = get_display_ratio(db)
+    total_received_actual, total_withdrawn, pending_withdrawal = usdt_totals(db)
+
+    displayed_received = total_received_actual * ratio
+
+    stats = {
+        "total_received_usdt": displayed_received,
+        "total_withdrawn_usdt": total_withdrawn,
+        "pending_withdrawal_usdt": pending_withdrawal,
+        "available_usdt": displayed_received - total_withdrawn - pending_withdrawal,
+    }
+    _stats_cache = (time.monotonic() + _STATS_CACHE_TTL, stats)
+    return stats
+
+
+def invalidate_stats_cache():
+    """집계에 영향을 주는 변경 후 호출 → 다음 /stats 조회 시 DB에서 다시 집계"""
+    global _stats_cache
+    _stats_cache = None
@@ -1,15 +1,25 @@
 # backend/app/services/wallet_monitor.py
 import time
 import logging
+import threading
 import requests
 from collections import OrderedDict
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from sqlalchemy import func as sqlfunc
 from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models import DepositRequest, Notification, Point, User
+from app.services.deposits import decimal_cents
+from app.services.exchange_rate import get_rate_snapshot
 from app.services.telegram import (
-    notify_deposit_detected,
     notify_deposit_matched,
     notify_deposit_underpaid,
     notify_deposit_unmatched,
 )
+from app.services.usdt_stats import invalidate_stats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +57,12 @@ _last_known_signature: str | None = None
 # [개선 3] 연속 에러 카운터 → 에러 시 폴링 간격 자동 증가
 _consecutive_errors: int = 0
 
+# 모니터 스레드 종료 신호 → 폴링 간 대기 중에도 즉시 깨어나 종료
+_stop_event = threading.Event()
+
+# 폴링 대기 중인 모니터를 깨우는 신호 (새 입금 요청 → 유휴 대기 단축 / 종료 시 즉시 반환)
+_wake_event = threading.Event()
+
 # ──────────────────────────────────────────────
 # [개선 4] RPC 호출 간 딜레이 설정
 # 무료 Solana RPC는 초당 ~10회 제한
@@ -55,6 +71,69 @@ _consecutive_errors: int = 0
 _RPC_CALL_DELAY = 0.3        # RPC 호출 사이 최소 대기 시간 (초)
 _BACKOFF_MAX_WAIT = 60       # exponential backoff 최대 대기 시간 (초)
 _BACKOFF_MAX_RETRIES = 4     # 최대 재시도 횟수 (1→2→4→8초 후 포기)
+_RPC_MAX_ATTEMPTS = _BACKOFF_MAX_RETRIES + 1  # 최초 호출 + 재시도
+_POLL_INTERVAL_MAX = 600     # 에러/유휴 시 늘어나는 폴링 간격 상한 (초)
+_USDT_DECIMALS_SCALE = 1_000_000  # USDT SPL 토큰 소수점 6자리
+_RPC_TIMEOUT = (5, 20)       # (connect, read) 초 - 연결이 안 되면 빨리 포기하고 backoff 재시도
+_RPC_MAX_WORKERS = 2         # getTransaction 동시 조회 워커 수 (무료 RPC rate limit 고려해 작게 유지)
+_SIGNATURE_MAX_PAGES = 10    # 한 번의 폴링에서 getSignaturesForAddress 최대 페이지 수
+_SPL_TRANSFER_TYPES = frozenset(("transfer", "transferChecked"))  # 입금으로 인식할 SPL 명령 타입
+
+# 호출마다 같은 값인 RPC 파라미터는 모듈 로드 시 1회 생성 (요청 시 읽기 전용으로만 사용)
+_GET_TX_CONFIG = {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}
+_USDT_MINT_FILTER = {"mint": SOLANA_USDT_MINT}
+_JSON_PARSED_CONFIG = {"encoding": "jsonParsed"}
+
+
+class SolanaTransfer(NamedTuple):
+    """getTransaction에서 파싱한 USDT 입금 1건 (tx마다 생성되는 경량 레코드)"""
+    tx_hash: str
+    amount: float
+    sender: str
+
+
+# ──────────────────────────────────────────────
+# RPC 전용 HTTP 세션 (keep-alive 커넥션 풀)
+# requests.post()는 호출마다 새 TCP+TLS 연결 → 폴링 1회에 여러 번 핸드셰이크
+# 세션을 재사용해 같은 RPC 호스트로의 연결을 유지
+# (재시도는 _solana_rpc의 backoff 로직이 담당하므로 어댑터 재시도는 사용 안 함)
+# ──────────────────────────────────────────────
+_rpc_session = requests.Session()
+_rpc_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# 다음 RPC 호출이 허용되는 시각 (monotonic)
+# getTransaction 워커 스레드들이 공유하므로 lock으로 보호 → 프로세스 전체 호출 간격 보장
+_next_rpc_at: float = 0.0
+_rpc_pace_lock = threading.Lock()
+
+
+def _wait_rpc_slot():
+    """
+    직전 RPC 호출로부터 _RPC_CALL_DELAY가 지나지 않았으면 남은 시간만 대기.
+    호출 후 무조건 sleep하던 방식과 달리, 이미 간격이 벌어졌으면
+    (마지막 호출이거나 DB 매칭 등으로 시간이 흐른 경우) 바로 호출한다.
+
+    lock 안에서는 호출 슬롯만 예약하고 sleep은 lock 밖에서 수행
+    → 여러 워커가 동시에 와도 슬롯이 _RPC_CALL_DELAY 간격으로 차례대로 배정됨
+    """
+    global _next_rpc_at
+    with _rpc_pace_lock:
+        now = time.monotonic()
+        slot = max(now, _next_rpc_at)
+        _next_rpc_at = slot + _RPC_CALL_DELAY
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _defer_rpc_slots(wait: float):
+    """
+    429/네트워크 에러 backoff: 다음 호출 슬롯을 wait초 뒤로 미룸.
+    재시도하는 스레드만 sleep하면 다른 워커는 서버가 기다리라고 한 구간에도 계속 호출하므로
+    공유 _next_rpc_at을 밀어 모든 호출자가 _wait_rpc_slot()에서 함께 대기하도록 함
+    """
+    global _next_rpc_at
+    with _rpc_pace_lock:
+        _next_rpc_at = max(_next_rpc_at, time.monotonic() + wait)
 
 
 # ──────────────────────────────────────────────
@@ -65,9 +144,6 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
     블록체인에서 감지된 입금을 DB의 pending 요청과 매칭.
     소수점 식별자(0.37 등)를 기반으로 매칭.
     """
-    from app.core.db import SessionLocal
-    from app.models import DepositRequest, ExchangeRate, Notification, Point
-
     db = SessionLocal()
     try:
         # 중복 처리 방지
@@ -75,12 +151,12 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
             DepositRequest.detected_tx_hash == tx_hash
         ).first()
         if existing:
-            logger.info(f"TX {tx_hash[:16]}... already matched to deposit #{existing.id}")
+            logger.info("TX %.16s... already matched to deposit #%s", tx_hash, existing.id)
             return
 
-        # 소수점 추출 (예: 200.37 → 0.37)
+        # 소수점 식별자 추출 (센트 정수, 예: 200.37 → 37)
         amount_rounded = round(amount, 2)
-        decimal_part = round(amount_rounded % 1, 2)
+        amount_cents = decimal_cents(amount_rounded)
 
         # 같은 체인의 pending 요청 중 소수점이 일치하는 것 찾기
         pending_requests = db.query(DepositRequest).filter(
@@ -91,13 +167,12 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
 
         matched = None
         for req in pending_requests:
-            req_decimal = round(float(req.expected_amount) % 1, 2)
-            if req_decimal == decimal_part and decimal_part > 0:
+            if amount_cents > 0 and decimal_cents(req.expected_amount) == amount_cents:
                 matched = req
                 break
 
         if not matched:
-            logger.warning(f"No matching deposit for {amount} USDT on {chain} (decimal: {decimal_part})")
+            logger.warning("No matching deposit for %s USDT on %s (decimal: 0.%02d)", amount, chain, amount_cents)
             notify_deposit_unmatched(amount=amount, sender=sender, tx_hash=tx_hash, chain=chain)
             return
 
@@ -105,15 +180,15 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
         matched.actual_amount = amount_rounded
         matched.detected_tx_hash = tx_hash
 
-        from app.models import User
-        from datetime import datetime
         user = db.query(User).filter(User.id == matched.user_id).first()
         user_email = user.email if user else "unknown"
 
-        rate = db.query(ExchangeRate).filter(ExchangeRate.is_active == True).first()
-        joy_per_usdt = float(rate.joy_per_usdt) if rate else 5.0
+        rate = get_rate_snapshot(db)
+        joy_per_usdt = rate["joy_per_usdt"]
 
-        expected_base = int(float(matched.expected_amount))
+        # Numeric → float 변환은 한 번만 하고 이후 계산/알림에서 재사용
+        expected_amount = float(matched.expected_amount)
+        expected_base = int(expected_amount)
         actual_base = int(amount_rounded)
         diff = expected_base - actual_base
 
@@ -126,10 +201,10 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
             if user:
                 user.total_joy = int(user.total_joy or 0) + int(matched.joy_amount or 0)
 
-            logger.info(f"Deposit auto-approved: #{matched.id} = {amount_rounded} USDT")
+            logger.info("Deposit auto-approved: #%s = %s USDT", matched.id, amount_rounded)
             notify_deposit_matched(
                 user_email=user_email,
-                expected=float(matched.expected_amount),
+                expected=expected_amount,
                 actual=amount_rounded,
                 joy_amount=matched.joy_amount,
                 chain=chain,
@@ -148,12 +223,12 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
                 user.total_joy = int(user.total_joy or 0) + recalculated_joy
 
             logger.warning(
-                f"Underpaid deposit #{matched.id}: expected {expected_base}, got {actual_base}. "
-                f"JOY: {recalculated_joy}"
+                "Underpaid deposit #%s: expected %s, got %s. JOY: %s",
+                matched.id, expected_base, actual_base, recalculated_joy,
             )
             notify_deposit_underpaid(
                 user_email=user_email,
-                expected=float(matched.expected_amount),
+                expected=expected_amount,
                 actual=amount_rounded,
                 original_joy=matched.joy_amount,
                 recalculated_joy=recalculated_joy,
@@ -177,11 +252,10 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
 
         # 추천 보상: 구매자의 추천인(referred_by)에게 포인트 지급 (횟수 제한 없음)
         if user and user.referred_by:
-            from sqlalchemy import func as sqlfunc
             referrer = db.query(User).filter(User.id == user.referred_by).first()
             if referrer:
-                bonus_pct = rate.referral_bonus_percent if rate else 10
-                usdt_amount = float(matched.actual_amount or matched.expected_amount or 0)
+                bonus_pct = rate["referral_bonus_percent"]
+                usdt_amount = amount_rounded  # 방금 actual_amount에 기록한 값
                 bonus_points = int(usdt_amount * bonus_pct / 100)
                 if bonus_points > 0:
                     current_balance = db.query(
@@ -196,13 +270,18 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
                     )
                     db.add(point_record)
                     referrer.total_points = int(referrer.total_points or 0) + bonus_points
-                    logger.info(f"Referral bonus: referrer #{referrer.id} +{bonus_points}pts from buyer #{user.id} ({bonus_pct}%)")
+                    logger.info(
+                        "Referral bonus: referrer #%s +%spts from buyer #%s (%s%%)",
+                        referrer.id, bonus_points, user.id, bonus_pct,
+                    )
 
         db.commit()
+        # 자동 승인으로 승인 입금 합계가 바뀌었으므로 US어드민 통계 캐시 무효화
+        invalidate_stats_cache()
 
     except Exception as e:
         db.rollback()
-        logger.error(f"Deposit matching error: {e}")
+        logger.error("Deposit matching error: %s", e)
     finally:
         db.close()
 
@@ -211,6 +290,15 @@ def _match_deposit_to_request(amount: float, sender: str, tx_hash: str, chain: s
 # Solana SPL USDT 모니터링
 # ──────────────────────────────────────────────
 
+def _retry_after(resp: requests.Response, default: float) -> float:
+    """429 응답의 Retry-After(초) 헤더 값, 없거나 숫자가 아니면 default"""
+    value = resp.headers.get("Retry-After")
+    try:
+        return max(float(value), 0.0) if value is not None else default
+    except ValueError:
+        return default
+
+
 def _solana_rpc(method: str, params: list) -> dict:
     """
     [개선 5] Solana RPC 호출 + exponential backoff 재시도
@@ -222,66 +310,77 @@ def _solana_rpc(method: str, params: list) -> dict:
       4차 재시도: 8초 대기
       → 그래도 실패하면 예외 발생 (다음 폴링 주기에 재시도)
 
-    모든 RPC 호출 후 _RPC_CALL_DELAY만큼 대기하여 초당 호출 수 제한
+    모든 RPC 호출 전 _wait_rpc_slot()으로 호출 간격을 _RPC_CALL_DELAY 이상 유지
+    backoff 대기는 _defer_rpc_slots()로 공유 슬롯을 미뤄 다른 워커 스레드에도 적용
     """
     last_error = None
 
-    for attempt in range(_BACKOFF_MAX_RETRIES + 1):
+    # 재시도해도 요청 본문은 같으므로 루프 밖에서 1회만 생성
+    payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+
+    for attempt in range(_RPC_MAX_ATTEMPTS):
         try:
-            payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-            resp = requests.post(SOLANA_RPC, json=payload, timeout=20)
+            _wait_rpc_slot()
+            resp = _rpc_session.post(SOLANA_RPC, json=payload, timeout=_RPC_TIMEOUT)
 
             # 429 발생 → backoff 후 재시도
+            # 서버가 Retry-After를 주면 그만큼만 대기 (고정 2^n초보다 정확)
             if resp.status_code == 429:
-                wait = min(2 ** attempt, _BACKOFF_MAX_WAIT)
+                wait = min(_retry_after(resp, 2 ** attempt), _BACKOFF_MAX_WAIT)
                 logger.warning(
-                    f"RPC 429 rate limited ({method}), "
-                    f"attempt {attempt + 1}/{_BACKOFF_MAX_RETRIES + 1}, "
-                    f"waiting {wait}s..."
+                    "RPC 429 rate limited (%s), attempt %d/%d, waiting %ss...",
+                    method, attempt + 1, _RPC_MAX_ATTEMPTS, wait,
                 )
-                time.sleep(wait)
+                _defer_rpc_slots(wait)
                 continue
 
             resp.raise_for_status()
-
-            # [개선 6] 호출 성공 후 다음 호출까지 딜레이
-            # 연속 호출로 rate limit에 걸리는 것을 방지
-            time.sleep(_RPC_CALL_DELAY)
-
             return resp.json()
 
-        except requests.exceptions.HTTPError as e:
-            if resp.status_code == 429:
-                last_error = e
-                continue  # 위에서 이미 처리됨
-            raise  # 429 이외의 HTTP 에러는 즉시 발생
+        except requests.exceptions.HTTPError:
+            # 429는 raise_for_status() 전에 처리되므로 여기는 그 외 HTTP 에러 → 즉시 발생
+            # (아래 RequestException 핸들러의 backoff 재시도 대상에서 제외)
+            raise
         except requests.exceptions.RequestException as e:
             # 네트워크 에러 (타임아웃 등)도 backoff 적용
             wait = min(2 ** attempt, _BACKOFF_MAX_WAIT)
-            logger.warning(f"RPC network error ({method}): {e}, waiting {wait}s...")
+            logger.warning("RPC network error (%s): %s, waiting %ss...", method, e, wait)
             last_error = e
-            time.sleep(wait)
+            _defer_rpc_slots(wait)
 
     # 모든 재시도 실패
-    logger.error(f"RPC {method} failed after {_BACKOFF_MAX_RETRIES + 1} attempts")
+    logger.error("RPC %s failed after %d attempts", method, _RPC_MAX_ATTEMPTS)
     raise last_error or Exception(f"RPC {method} failed")
 
 
+def _dig(data, *path, default=None):
+    """
+    중첩 dict에서 path 순서대로 값 조회.
+    중간 값이 dict가 아니거나 None(JSON null)이면 default 반환
+    (예: getTransaction 결과의 "meta": null 도 AttributeError 없이 처리)
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+    return default if data is None else data
+
+
 def get_solana_usdt_token_account(wallet_address: str) -> str | None:
     """관리자 지갑의 USDT 토큰 계정 주소 조회"""
     try:
         result = _solana_rpc("getTokenAccountsByOwner", [
             wallet_address,
-            {"mint": SOLANA_USDT_MINT},
-            {"encoding": "jsonParsed"},
+            _USDT_MINT_FILTER,
+            _JSON_PARSED_CONFIG,
         ])
-        accounts = result.get("result", {}).get("value", [])
+        accounts = _dig(result, "result", "value", default=())
         if accounts:
             return accounts[0]["pubkey"]
-        logger.warning(f"No USDT token account found for {wallet_address}")
+        logger.warning("No USDT token account found for %s", wallet_address)
         return None
     except Exception as e:
-        logger.error(f"Solana getTokenAccountsByOwner error: {e}")
+        logger.error("Solana getTokenAccountsByOwner error: %s", e)
         return None
 
 
@@ -295,34 +394,104 @@ def _fetch_new_signatures(token_account: str, limit: int = 15) -> list[dict]:
     개선: _last_known_signature 이후의 새 tx만 조회
     - until 파라미터: 마지막으로 본 signature 이후만 가져옴
     - limit도 30 → 15로 줄임 (90초 간격이면 15개면 충분)
+    - 페이지가 가득 차면 before로 이어서 until까지 조회
+      (유휴 간격이 최대 600초로 늘어나도 limit 초과분을 건너뛰지 않도록,
+       최대 _SIGNATURE_MAX_PAGES 페이지)
+
+    RPC 에러는 삼키지 않고 호출자로 전파 → wallet_monitor_loop에서
+    _consecutive_errors가 증가해 폴링 간격이 늘어나도록 함
+    (페이지 조회 도중 실패하면 _last_known_signature를 갱신하지 않으므로 다음 폴링에서 다시 조회)
     """
     global _last_known_signature
 
-    try:
-        # until 파라미터로 마지막 확인 이후의 새 tx만 가져오기
-        params: dict = {"limit": limit}
-        if _last_known_signature:
-            params["until"] = _last_known_signature
+    # until 파라미터로 마지막 확인 이후의 새 tx만 가져오기
+    params: dict = {"limit": limit}
+    if _last_known_signature:
+        params["until"] = _last_known_signature
 
+    signatures: list[dict] = []
+    for _ in range(_SIGNATURE_MAX_PAGES):
         sig_result = _solana_rpc("getSignaturesForAddress", [
             token_account,
             params,
         ])
-        signatures = sig_result.get("result", [])
+        page = sig_result.get("result", [])
+        signatures.extend(page)
+
+        # 마지막 페이지(limit 미만)거나 첫 실행(until 없음)이면 종료
+        if len(page) < limit or not _last_known_signature:
+            break
+        params = {**params, "before": page[-1].get("signature")}
+    else:
+        logger.warning(
+            "Signature paging stopped at %d pages (%d signatures); older ones are skipped",
+            _SIGNATURE_MAX_PAGES, len(signatures),
+        )
 
-        # 새 signature가 있으면 가장 최신 것을 기록
-        # (signatures는 최신순 정렬이므로 첫 번째가 가장 최신)
-        if signatures:
-            _last_known_signature = signatures[0].get("signature")
+    # 새 signature가 있으면 가장 최신 것을 기록
+    # (signatures는 최신순 정렬이므로 첫 번째가 가장 최신)
+    if signatures:
+        _last_known_signature = signatures[0].get("signature")
+
+    return signatures
 
-        return signatures
+
+def _fetch_transfer(sig: str, token_account: str) -> tuple[SolanaTransfer | None, bool]:
+    """
+    tx 1건을 getTransaction으로 조회해 token_account로 들어온 USDT transfer 파싱
+
+    반환: (transfer 또는 None, known 처리 여부)
+    - tx가 없거나 조회/파싱 에러 → 다시 조회하지 않도록 known 처리
+    - known 캐시 갱신은 호출 스레드에서 수행 (워커 스레드에서는 읽기만)
+    """
+    try:
+        tx_result = _solana_rpc("getTransaction", [
+            sig,
+            _GET_TX_CONFIG,
+        ])
+        tx = tx_result.get("result")
+        if not tx:
+            # tx가 없으면 이미 알려진 것으로 표시 (다음에 다시 조회 안 함)
+            return None, True
+
+        # SPL 토큰 transfer 명령어 파싱
+        all_instructions = list(_dig(tx, "transaction", "message", "instructions", default=()))
+        for inner_group in _dig(tx, "meta", "innerInstructions", default=()):
+            all_instructions.extend(_dig(inner_group, "instructions", default=()))
+
+        for ix in all_instructions:
+            if ix.get("program") != "spl-token":
+                continue
+            parsed = ix.get("parsed") or {}
+            if parsed.get("type") not in _SPL_TRANSFER_TYPES:
+                continue
+            info = parsed.get("info") or {}
+            if info.get("destination") != token_account:
+                continue
+
+            # 금액 파싱 (tokenAmount.uiAmount 우선, 없으면 raw amount 환산)
+            ui_amount = _dig(info, "tokenAmount", "uiAmount")
+            if ui_amount is None:
+                ui_amount = int(info.get("amount", 0)) / _USDT_DECIMALS_SCALE
+
+            sender = info.get("authority") or info.get("source", "unknown")
+            # 같은 tx에서 첫 번째 매칭만
+            return SolanaTransfer(
+                tx_hash=sig,
+                amount=round(float(ui_amount), 2),
+                sender=sender,
+            ), False
+
+        return None, False
 
     except Exception as e:
-        logger.error(f"Solana getSignaturesForAddress error: {e}")
-        return []
+        logger.error("Solana tx parse error (%.16s...): %s", sig, e)
+        # 에러 발생한 tx도 기록하여 다음에 다시 시도하지 않음
+        # (단, 429 에러는 _solana_rpc 내부에서 재시도하므로 여기 도달 시 진짜 실패)
+        return None, True
 
 
-def fetch_solana_usdt_transfers(token_account: str, limit: int = 15) -> list[dict]:
+def fetch_solana_usdt_transfers(token_account: str, limit: int = 15) -> list[SolanaTransfer]:
     """
     [개선 8] Solana USDT 입금 내역 조회 (최적화)
 
@@ -351,89 +520,60 @@ def fetch_solana_usdt_transfers(token_account: str, limit: int = 15) -> list[dic
         logger.debug("No new signatures to process")
         return []
 
-    logger.info(f"Found {len(new_sigs)} new signatures to check")
+    logger.info("Found %d new signatures to check", len(new_sigs))
 
     # [개선 9] 새 tx만 getTransaction 호출 (딜레이는 _solana_rpc 내부에서 처리)
-    transfers = []
-    for sig in new_sigs:
-        try:
-            tx_result = _solana_rpc("getTransaction", [
-                sig,
-                {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0},
-            ])
-            tx = tx_result.get("result")
-            if not tx:
-                # tx가 없으면 이미 알려진 것으로 표시 (다음에 다시 조회 안 함)
-                _add_known_tx(f"Solana:{sig}")
-                continue
-
-            # SPL 토큰 transfer 명령어 파싱
-            instructions = (
-                tx.get("transaction", {})
-                .get("message", {})
-                .get("instructions", [])
-            )
-            inner = tx.get("meta", {}).get("innerInstructions", [])
-            all_instructions = list(instructions)
-            for inner_group in inner:
-                all_instructions.extend(inner_group.get("instructions", []))
-
-            for ix in all_instructions:
-                if ix.get("program") != "spl-token":
-                    continue
-                parsed = ix.get("parsed", {})
-                if parsed.get("type") not in ("transfer", "transferChecked"):
-                    continue
-                info = parsed.get("info", {})
-                dest = info.get("destination") or info.get("destination", "")
-                if dest != token_account:
-                    continue
-
-                # 금액 파싱
-                token_amount = info.get("tokenAmount", {})
-                ui_amount = token_amount.get("uiAmount") if token_amount else None
-                if ui_amount is None:
-                    raw = int(info.get("amount", 0))
-                    ui_amount = raw / 1_000_000  # USDT 6 decimals
-
-                sender = info.get("authority") or info.get("source", "unknown")
-                transfers.append({
-                    "tx_hash": sig,
-                    "amount": round(float(ui_amount), 2),
-                    "sender": sender,
-                })
-                break  # 같은 tx에서 첫 번째 매칭만
+    # tx별 조회는 서로 독립적이므로 소수 워커로 동시에 조회 → RTT가 직렬로 누적되지 않음
+    with ThreadPoolExecutor(max_workers=_RPC_MAX_WORKERS) as pool:
+        results = list(pool.map(lambda sig: _fetch_transfer(sig, token_account), new_sigs))
 
-        except Exception as e:
-            logger.error(f"Solana tx parse error ({sig[:16]}...): {e}")
-            # 에러 발생한 tx도 기록하여 다음에 다시 시도하지 않음
-            # (단, 429 에러는 _solana_rpc 내부에서 재시도하므로 여기 도달 시 진짜 실패)
+    transfers = []
+    for sig, (transfer, mark_known) in zip(new_sigs, results):
+        if mark_known:
             _add_known_tx(f"Solana:{sig}")
-            continue
+        if transfer:
+            transfers.append(transfer)
 
     return transfers
 
 
-def _process_solana_txs(transfers: list[dict]):
+def _process_solana_txs(transfers: list[SolanaTransfer]):
     """감지된 입금을 DB와 매칭하고 처리 완료 표시"""
+    new_transfers = []
     for t in transfers:
-        key = f"Solana:{t['tx_hash']}"
+        key = f"Solana:{t.tx_hash}"
         if _is_known_tx(key):
             continue
 
-        amount = t["amount"]
-        if amount <= 0:
+        if t.amount <= 0:
             _add_known_tx(key)
             continue
 
-        logger.info(f"[Solana] USDT deposit: {amount} from {t['sender']} (tx: {t['tx_hash'][:16]}...)")
+        new_transfers.append(t)
+
+    if not new_transfers:
+        return
+
+    # 감지 내역을 한 번의 로그 호출로 출력 (tx마다 logger 호출 → 1회)
+    # INFO가 꺼져 있으면 목록 문자열 조립 자체를 건너뜀
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[Solana] %d USDT deposit(s) detected:\n%s",
+            len(new_transfers),
+            "\n".join(
+                f"  - {t.amount} from {t.sender} (tx: {t.tx_hash[:16]}...)"
+                for t in new_transfers
+            ),
+        )
+
+    for t in new_transfers:
         _match_deposit_to_request(
-            amount=amount,
-            sender=t["sender"],
-            tx_hash=t["tx_hash"],
+            amount=t.amount,
+            sender=t.sender,
+            tx_hash=t.tx_hash,
             chain="Solana",
         )
-        _add_known_tx(key)
+        _add_known_tx(f"Solana:{t.tx_hash}")
 
 
 # ──────────────────────────────────────────────
@@ -479,12 +619,12 @@ def _init_known_txs():
             _last_known_signature = signatures[0].get("signature")
 
         logger.info(
-            f"Solana init: {len(signatures)} existing signatures marked as known "
-            f"(RPC calls: 2, getTransaction: 0)"
+            "Solana init: %d existing signatures marked as known (RPC calls: 2, getTransaction: 0)",
+            len(signatures),
         )
 
     except Exception as e:
-        logger.error(f"Solana init error: {e}")
+        logger.error("Solana init error: %s", e)
 
 
 def poll_wallet_once():
@@ -493,7 +633,8 @@ def poll_wallet_once():
 
     변경점:
     - 에러 발생 시 _consecutive_errors 증가 → 폴링 간격 자동 증가
-    - 성공 시 에러 카운터 초기화
+    - 성공 시 에러 카운터를 1씩 감소 → 간격을 절반씩 줄이며 기본 간격으로 복귀
+      (rate limit 직후 바로 기본 간격으로 돌아가 다시 429를 맞는 것을 방지)
     """
     global _solana_token_account, _consecutive_errors
 
@@ -508,8 +649,25 @@ def poll_wallet_once():
     if _solana_token_account:
         transfers = fetch_solana_usdt_transfers(_solana_token_account)
         _process_solana_txs(transfers)
-        # 성공 시 에러 카운터 초기화
-        _consecutive_errors = 0
+        # 성공 시 에러 카운터 점진 감소
+        if _consecutive_errors > 0:
+            _consecutive_errors -= 1
+
+
+def _has_pending_solana_deposits() -> bool:
+    """매칭 대기 중인 Solana 입금 요청이 있는지 (조회 실패 시 있다고 간주)"""
+    db = SessionLocal()
+    try:
+        return db.query(DepositRequest.id).filter(
+            DepositRequest.chain == "Solana",
+            DepositRequest.status == "pending",
+            DepositRequest.detected_tx_hash == None,
+        ).first() is not None
+    except Exception as e:
+        logger.warning("Pending deposit check failed: %s", e)
+        return True
+    finally:
+        db.close()
 
 
 def wallet_monitor_loop():
@@ -519,28 +677,70 @@ def wallet_monitor_loop():
     변경점:
     - 기본 폴링 간격: 90초 (기존 60초)
     - 에러 발생 시 간격 자동 증가 (90→180→360초, 최대 600초)
-    - 연속 성공 시 기본 간격으로 복귀
+    - 성공할 때마다 간격을 절반씩 줄여 기본 간격으로 복귀
+    - stop_wallet_monitor() 호출 시 대기 중이어도 바로 루프 종료
+    - 매칭 대기 중인 입금 요청이 없으면 유휴 간격을 2배씩 늘림 (최대 600초)
+      → 새 입금 요청 생성 시 wake_wallet_monitor()로 유휴 대기만 끝내고 기본 간격으로 복귀
+        (에러 backoff나 기본 간격 대기 중에는 깨워도 다음 폴링 시각을 당기지 않음)
     """
     global _consecutive_errors
 
     base_interval = settings.WALLET_POLL_INTERVAL_SECONDS or 90
-    logger.info(f"Wallet monitor started (Solana, base polling every {base_interval}s)")
+    logger.info("Wallet monitor started (Solana, base polling every %ss)", base_interval)
 
     _init_known_txs()
 
-    while True:
+    idle_interval = base_interval
+
+    while not _stop_event.is_set():
+        # 폴링 시작 시각 기준으로 다음 폴링 시각(deadline) 계산
+        # → 실제 주기가 "interval + 폴링 소요 시간"으로 밀리지 않도록 함
+        cycle_start = time.monotonic()
+        _wake_event.clear()
         try:
             poll_wallet_once()
         except Exception as e:
             _consecutive_errors += 1
-            logger.error(f"Wallet monitor error (consecutive: {_consecutive_errors}): {e}")
+            logger.error("Wallet monitor error (consecutive: %d): %s", _consecutive_errors, e)
 
         # [개선 13] 에러 시 폴링 간격 자동 증가 (adaptive interval)
         # 연속 에러가 많을수록 대기 시간 증가 → RPC 서버 부담 감소
+        is_idle_wait = False
         if _consecutive_errors > 0:
-            interval = min(base_interval * (2 ** _consecutive_errors), 600)
-            logger.info(f"Increased polling interval to {interval}s (errors: {_consecutive_errors})")
+            interval = min(base_interval * (2 ** _consecutive_errors), _POLL_INTERVAL_MAX)
+            logger.info("Increased polling interval to %ss (errors: %d)", interval, _consecutive_errors)
+        elif _has_pending_solana_deposits():
+            interval = idle_interval = base_interval
         else:
-            interval = base_interval
+            # 매칭할 요청이 없으면 폴링 빈도를 낮춤 (새 요청이 생기면 wake로 기본 간격 복귀)
+            interval = idle_interval
+            idle_interval = min(idle_interval * 2, max(_POLL_INTERVAL_MAX, base_interval))
+            is_idle_wait = True
+
+        # 폴링이 interval보다 오래 걸렸으면 대기 없이 바로 다음 폴링
+        # time.sleep 대신 Event.wait → 종료 신호가 오면 대기 도중에도 바로 반환
+        deadline = cycle_start + interval
+        while not _stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not _wake_event.wait(remaining):
+                break
+            _wake_event.clear()
+            # 새 입금 요청 → 유휴 대기만 기본 간격 기준으로 단축
+            # (에러 backoff 중에는 rate limit된 RPC를 다시 두드리지 않도록 deadline 유지)
+            if is_idle_wait:
+                idle_interval = base_interval
+                deadline = min(deadline, cycle_start + base_interval)
+                is_idle_wait = False
+
+    logger.info("Wallet monitor stopped")
+
+
+def wake_wallet_monitor():
+    """유휴 간격으로 대기 중인 모니터를 기본 간격으로 되돌림 (새 입금 요청 생성 시 호출)"""
+    _wake_event.set()
+
 
-        time.sleep(interval)
+def stop_wallet_monitor():
+    """모니터 루프에 종료 신호 전송 (진행 중인 폴링이 끝나면 루프 종료)"""
+    _stop_event.set()
+    _wake_event.set()